@@ -11,22 +11,31 @@ Responsibilities:
 # Product pages remain pure Scrapy (fast + stable) and brightdata in terminal.
 
 import json
+import logging
 import os
 import re
-import time
 import uuid
-import subprocess
 from datetime import datetime, timezone
-from urllib.parse import urlparse, urlunparse, parse_qsl, urlencode
+from functools import cached_property, lru_cache
+from urllib.parse import urlparse, urlsplit, urlunparse, parse_qsl, urlencode
 
 import scrapy
+from lxml import etree
 from scrapy.selector import Selector
+from scrapy.utils.request import fingerprint
+
+try:
+    # orjson is optional: it returns the same dict/list structures as json, only faster.
+    import orjson
+except ImportError:
+    orjson = None
 
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
 from webdriver_manager.chrome import ChromeDriverManager
 
@@ -77,6 +86,67 @@ EXCLUDED_CATEGORY_KEYWORDS = {
     "tas", "tassen", "vervangingsonderdelen", "onderdelen",
 }
 
+# Promotion/brand/outlet sections that are never real microphone subcategories
+BLOCKED_CATEGORY_PATH_KEYWORDS = {
+    "video-podcast", "blowouts",
+    "aktionen", "actie", "acties",
+    "b_stock", "b-stock",
+    "sale", "deals", "outlet",
+    "topseller",
+    "prodnews",
+    "bf_", "blackfriday",
+    "alle-producten-in-de-categorie",
+    "brand", "merken",
+}
+
+# On depth 1/2, a subcategory URL must contain one of these microphone keywords
+MIC_URL_KEYWORDS = (
+    "microfoon", "microfoons", "mikro", "micro",
+    "zangmicro", "instrumentenmicro",
+    "condensator", "grootmembraan", "kleinmembraan",
+    "ribbon", "headset", "lavalier",
+    "usb", "podcast", "broadcast",
+    "zender", "video", "camera", "reporter",
+    "grensvlak", "installatie", "meetmicro", "ovid",
+)
+
+# Keyword sets compiled into one alternation each: a single C-level scan per string
+# instead of one Python "in" test per keyword for every anchor on a hub page.
+_EXCLUDED_CATEGORY_RE = re.compile("|".join(map(re.escape, sorted(EXCLUDED_CATEGORY_KEYWORDS))))
+_BLOCKED_CATEGORY_PATH_RE = re.compile("|".join(map(re.escape, sorted(BLOCKED_CATEGORY_PATH_KEYWORDS))))
+_MIC_URL_RE = re.compile("|".join(map(re.escape, MIC_URL_KEYWORDS)))
+
+# Info pages that end in .htm but are not products
+_BAD_PRODUCT_PATH_RE = re.compile("|".join(map(re.escape, (
+    "/compinfo", "compinfo_", "accessibility", "whistleblower",
+    "privacy", "impressum", "terms", "agb", "datenschutz", "kontakt", "about",
+))))
+# Sections should_follow_url never crawls
+_BAD_FOLLOW_PATH_RE = re.compile("|".join(map(re.escape, (
+    "/cart", "/checkout", "/login", "/account", "/wishlist", "/compare",
+    "/compinfo", "compinfo_", "accessibility", "whistleblower",
+))))
+_ASSET_EXTENSIONS = (".pdf", ".jpg", ".jpeg", ".png", ".webp", ".svg", ".zip")
+
+# Brand pages inside the microphone tree (e.g. "..._shure_microfoons.html")
+_BRAND_MIC_PATH_RE = re.compile(r"_[a-z0-9]+_microfoons?")
+
+# Text patterns used on every product page, compiled once at import time
+_WS_RE = re.compile(r"\s+")
+_TRAILING_COUNT_RE = re.compile(r"\s*\(\s*\d+\s*\)\s*$")
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9]+")
+_EURO_AMOUNT_RE = re.compile(r"€\s*\d[\d\.\s]*[,\.\d]{0,3}\d")
+_REF30_RE = re.compile(
+    r"30\s*-\s*Dagen\s*-\s*Beste\s*-\s*Prijs\s*:\s*€\s*([\d\.\s]+(?:,\d{1,2})?)", re.IGNORECASE
+)
+_REF30_PLAIN_RE = re.compile(
+    r"30\s*Dagen\s*Beste\s*Prijs\s*:\s*€\s*([\d\.\s]+(?:,\d{1,2})?)", re.IGNORECASE
+)
+
+
+
+# JSON-LD GTIN fields, in order of preference
+GTIN_KEYS = ("gtin13", "gtin14", "gtin12", "gtin8", "gtin")
 
 
 # Helper functions
@@ -91,7 +161,7 @@ def clean(s):
     # Small helper to normalize whitespace and convert empty strings to None.
     if s is None:
         return None
-    s = re.sub(r"\s+", " ", str(s)).strip()
+    s = _WS_RE.sub(" ", str(s)).strip()
     return s or None
 
 
@@ -101,11 +171,11 @@ def normalize_category_label(s: str) -> str:
         return ""
     s = (clean(s) or "").lower()
     # Remove trailing counts like "(123)"
-    s = re.sub(r"\s*\(\s*\d+\s*\)\s*$", "", s)
+    s = _TRAILING_COUNT_RE.sub("", s)
     # Normalize common separators
     s = s.replace("-", " ").replace("/", " ")
     # Collapse whitespace
-    s = re.sub(r"\s+", " ", s).strip()
+    s = _WS_RE.sub(" ", s).strip()
     return s
 
 
@@ -113,10 +183,14 @@ def normalize_category_label(s: str) -> str:
 ALLOWED_SUBCATEGORY_NAMES_SEED_NORM = {normalize_category_label(x) for x in ALLOWED_SUBCATEGORY_NAMES_SEED}
 
 
+@lru_cache(maxsize=200_000)
 def canonicalize_url_keep_meaning(url: str) -> str:
     """
     I remove typical tracking parameters (utm, ref, etc.) but keep functional
     query parameters. This is safer than removing the entire query string.
+
+    The function is pure, so results are memoized: the same URL is seen during
+    discovery, when yielding the Request and again in parse_product.
     """
     if not url:
         return url
@@ -152,11 +226,96 @@ def strip_tracking(url: str) -> str:
     return canonicalize_url_keep_meaning(url)
 
 
+def fast_join(response, href: str) -> str:
+    """
+    Cheap urljoin for the common href shapes. Root-relative paths are prefixed
+    with the page's scheme://netloc (parsed once per response), absolute URLs are
+    kept as-is; anything else goes through response.urljoin.
+    """
+    if href.startswith("/") and not href.startswith("//"):
+        prefix = response.meta.get("_base_prefix")
+        if prefix is None:
+            base = urlsplit(response.url)
+            prefix = response.meta["_base_prefix"] = f"{base.scheme}://{base.netloc}"
+        return prefix + href
+    if href.startswith(("http://", "https://")):
+        return href
+    return response.urljoin(href)
+
+
+def join_and_strip(response, href: str) -> str:
+    """
+    urljoin + strip_tracking with a small per-page memo on response.meta,
+    so repeated anchors on the same page (menus, tiles, footers) are resolved once.
+    """
+    cache = response.meta.setdefault("_canon_join", {})
+    u = cache.get(href)
+    if u is None:
+        u = strip_tracking(fast_join(response, href))
+        cache[href] = u
+    return u
+
+
+def response_url(response) -> str:
+    """
+    Canonical URL of a response. Requests built by this spider already carry a
+    stripped URL (meta["canonical"]); unless a redirect changed it, that is reused
+    as-is. Otherwise it is canonicalized once and kept on response.meta.
+    """
+    meta = response.meta
+    u = meta.get("_canonical_url")
+    if u is None:
+        if meta.get("canonical") and not meta.get("redirect_urls"):
+            u = response.url
+        else:
+            u = strip_tracking(response.url)
+        meta["_canonical_url"] = u
+    return u
+
+
+class CanonicalUrlRequestFingerprinter:
+    """
+    Request fingerprinter that hashes the tracking-free URL, so utm/ref variants
+    of the same page share one HTTP cache entry (and one dupefilter entry).
+    """
+
+    @classmethod
+    def from_crawler(cls, crawler):
+        return cls()
+
+    def fingerprint(self, request):
+        # Requests flagged meta["canonical"] were built from stripped URLs already. A
+        # redirect copies that meta onto the target request, so a request with
+        # redirect_urls is stripped again (same rule as response_url).
+        meta = request.meta
+        if not meta.get("canonical") or meta.get("redirect_urls"):
+            canonical = strip_tracking(request.url)
+            if canonical != request.url:
+                request = request.replace(url=canonical)
+        return fingerprint(request)
+
+
+class _PriceCharTable(dict):
+    """
+    str.translate table for price_to_float: keeps decimal digits, "," and "."
+    and deletes every other code point (the same characters the old regex strip kept).
+    Unknown code points are resolved once and then served from the dict.
+    """
+
+    def __missing__(self, cp):
+        keep = cp if chr(cp).isdecimal() or cp in (44, 46) else None
+        self[cp] = keep
+        return keep
+
+
+_PRICE_CHARS = _PriceCharTable()
+
+
 def price_to_float(text):
     # Convert EU price notation to float (e.g., "€ 1.299,00" -> 1299.00).
     if text is None:
         return None
-    t = re.sub(r"[^\d,\.]", "", str(text))
+    t = str(text).translate(_PRICE_CHARS)
     if not t:
         return None
     if "," in t:
@@ -180,37 +339,123 @@ def sane_price(p):
     return p
 
 
+def _find_git_dir():
+    # Walk up from this file to the repository's .git directory.
+    d = os.path.dirname(os.path.abspath(__file__))
+    while True:
+        git_dir = os.path.join(d, ".git")
+        if os.path.isdir(git_dir):
+            return git_dir
+        parent = os.path.dirname(d)
+        if parent == d:
+            return None
+        d = parent
+
+
+@lru_cache(maxsize=1)
 def get_git_commit_hash():
     # I store the git commit hash so the dataset is reproducible.
+    # Read .git/HEAD (and the ref it points to) directly instead of spawning git.
+    try:
+        git_dir = _find_git_dir()
+        if not git_dir:
+            return None
+
+        with open(os.path.join(git_dir, "HEAD"), encoding="utf-8") as f:
+            head = f.read().strip()
+        if not head.startswith("ref: "):
+            return head or None
+
+        ref = head[5:].strip()
+        ref_path = os.path.join(git_dir, *ref.split("/"))
+        if os.path.exists(ref_path):
+            with open(ref_path, encoding="utf-8") as f:
+                return f.read().strip() or None
+
+        # Refs can also live in packed-refs ("<hash> <ref>" per line)
+        with open(os.path.join(git_dir, "packed-refs"), encoding="utf-8") as f:
+            for line in f:
+                parts = line.split()
+                if len(parts) == 2 and parts[1] == ref:
+                    return parts[0]
+        return None
+    except OSError:
+        return None
+
+
+def iter_json_ld(obj) -> list:
+    # All JSON-LD dict nodes, including @graph structures, in document order.
+    # Iterative (explicit stack, children pushed reversed) instead of nested generators.
+    out = []
+    stack = [obj]
+    while stack:
+        cur = stack.pop()
+        if isinstance(cur, dict):
+            out.append(cur)
+            g = cur.get("@graph")
+            if isinstance(g, list):
+                stack.extend(reversed(g))
+        elif isinstance(cur, list):
+            stack.extend(reversed(cur))
+    return out
+
+
+def load_json_ld(block):
+    """
+    Parse a single <script type="application/ld+json"> body.
+    Accepts str or raw bytes (see json_ld_blocks).
+    Returns None for empty or malformed blocks (anything not starting with { or [).
+    """
+    b = (block or "").strip()
+    if b[:1] not in ("{", "[", b"{", b"["):
+        return None
     try:
-        out = subprocess.check_output(["git", "rev-parse", "HEAD"], stderr=subprocess.DEVNULL)
-        return out.decode("utf-8", errors="ignore").strip() or None
+        if orjson is not None:
+            return orjson.loads(b)
+        return json.loads(b)
     except Exception:
         return None
 
 
-def iter_json_ld(obj):
-    # Recursively iterate JSON-LD nodes, including @graph structures.
-    if isinstance(obj, dict):
-        yield obj
-        g = obj.get("@graph")
-        if isinstance(g, list):
-            for x in g:
-                yield from iter_json_ld(x)
-    elif isinstance(obj, list):
-        for x in obj:
-            yield from iter_json_ld(x)
+_JSONLD_RE_B = re.compile(
+    rb"""<script[^>]+type\s*=\s*["']application/ld\+json["'][^>]*>(.*?)</script>""",
+    re.IGNORECASE | re.DOTALL,
+)
+
+
+def json_ld_blocks(response):
+    """
+    Yield the raw bodies of all <script type="application/ld+json"> tags.
+    For a Response they are cut straight out of response.body (bytes), so no
+    SelectorList / str copies are built; a bare Selector falls back to css().
+    """
+    body = getattr(response, "body", None)
+    if body:
+        for m in _JSONLD_RE_B.finditer(body):
+            yield m.group(1)
+        return
+    yield from response.css('script[type="application/ld+json"]::text').getall()
+
+
+def _first_dict(x):
+    # JSON-LD values can be a single object or a list of objects; return the first object.
+    if isinstance(x, dict):
+        return x
+    if isinstance(x, list) and x and isinstance(x[0], dict):
+        return x[0]
+    return None
 
 
+@lru_cache(maxsize=16384)
 def looks_like_category_url(url: str) -> bool:
     # On Thomann, categories typically end with .html (products with .htm).
     if not url:
         return False
-    u = urlparse(url)
-    path = (u.path or "").lower()
-    return path.endswith(".html") and not path.endswith(".htm")
+    # A path ending in ".html" can never also end in ".htm", so one check is enough.
+    return urlsplit(url).path.lower().endswith(".html")
 
 
+@lru_cache(maxsize=16384)
 def is_product_url(url: str) -> bool:
     # Product pages usually end with .htm. I also exclude known info pages.
     if not url:
@@ -221,16 +466,10 @@ def is_product_url(url: str) -> bool:
     if not path.endswith(".htm"):
         return False
 
-    bad_parts = [
-        "/compinfo", "compinfo_", "accessibility", "whistleblower",
-        "privacy", "impressum", "terms", "agb", "datenschutz", "kontakt", "about",
-    ]
-    if any(bp in path for bp in bad_parts):
-        return False
-
-    return True
+    return not _BAD_PRODUCT_PATH_RE.search(path)
 
 
+@lru_cache(maxsize=16384)
 def should_follow_url(url: str) -> bool:
     # Central allow/deny filter for URLs I will crawl.
     if not url:
@@ -242,43 +481,79 @@ def should_follow_url(url: str) -> bool:
     path = (u.path or "").lower()
 
     # Skip assets
-    if any(path.endswith(ext) for ext in (".pdf", ".jpg", ".jpeg", ".png", ".webp", ".svg", ".zip")):
+    if path.endswith(_ASSET_EXTENSIONS):
         return False
 
     # Skip clearly irrelevant sections
-    bad = [
-        "/cart", "/checkout", "/login", "/account", "/wishlist", "/compare",
-        "/compinfo", "compinfo_", "accessibility", "whistleblower",
-    ]
-    if any(x in path for x in bad):
+    if _BAD_FOLLOW_PATH_RE.search(path):
         return False
 
     # Accept only category (.html) and product (.htm)
     return path.endswith(".html") or path.endswith(".htm")
 
 
-def extract_listing_id_from_html(html: str):
+# Thomann article numbers: five or more digits
+_ARTNR_RE = re.compile(r"\d{5,}")
+
+# Byte patterns: they run on response.body, so the HTML never has to be decoded.
+_ARTIKEL_RE_B = re.compile(rb"artikelnummer\s*[:#]?\s*(\d{5,})", re.IGNORECASE)
+_PROD_IMG_RE_B = re.compile(rb"/prod/(\d{5,})\.(?:jpg|jpeg|png)", re.IGNORECASE)
+
+
+def extract_listing_id_from_html(response):
     """
     On Thomann, the "artikelnummer" is very stable.
     I use it as listing_id to keep IDs consistent across competitors.
     """
-    if not html:
+    body = response.body
+    if not body:
         return None
 
-    m = re.search(r"artikelnummer\s*[:#]?\s*(\d{5,})", html, flags=re.IGNORECASE)
+    m = _ARTIKEL_RE_B.search(body)
     if m:
-        return m.group(1)
+        return m.group(1).decode("ascii")
 
     # Fallback: sometimes the product ID appears in image URLs
-    m = re.search(r"/prod/(\d{5,})\.(?:jpg|jpeg|png)", html, flags=re.IGNORECASE)
+    m = _PROD_IMG_RE_B.search(body)
     if m:
-        return m.group(1)
+        return m.group(1).decode("ascii")
 
     return None
 
 
+def extract_listing_id(response):
+    """
+    listing_id for a product response, memoized on response.meta["_listing_id"]
+    so parse_any and parse_product share one lookup.
+    The Product JSON-LD sku (already parsed for parse_product) is tried first, then
+    microdata; the full-HTML regex only runs when both miss.
+    """
+    if "_listing_id" in response.meta:
+        return response.meta["_listing_id"]
+
+    listing_id = None
+    for n in _parse_jsonld(response):
+        t = n.get("@type")
+        if t == "Product" or (isinstance(t, list) and "Product" in t):
+            m = _ARTNR_RE.search(str(n.get("sku") or ""))
+            if m:
+                listing_id = m.group(0)
+                break
+    if not listing_id:
+        listing_id = response.css(
+            '[itemprop="sku"]::text, [itemprop="productID"]::text, .product-artnr::text'
+        ).re_first(_ARTNR_RE)
+    if not listing_id:
+        listing_id = extract_listing_id_from_html(response)
+
+    response.meta["_listing_id"] = listing_id
+    return listing_id
+
+
+@lru_cache(maxsize=4096)
 def normalize_bad_model(model):
     # Light model normalization (avoid obviously wrong "models").
+    # Pure str -> str, memoized: many products share a model family.
     if not model:
         return None
     m = clean(model)
@@ -287,43 +562,39 @@ def normalize_bad_model(model):
     return m
 
 
+@lru_cache(maxsize=8192)
 def canonicalize_name(brand, title, model):
     # Canonical name helps matching the same product across competitors.
+    # Pure, memoized on (brand, title, model).
     parts = [clean(brand), clean(title), clean(model)]
     parts = [p for p in parts if p]
     if not parts:
         return None
     s = " ".join(parts).lower()
-    s = re.sub(r"[^a-z0-9]+", " ", s).strip()
-    s = re.sub(r"\s+", " ", s)
+    s = _NON_ALNUM_RE.sub(" ", s).strip()
+    s = _WS_RE.sub(" ", s)
     return s or None
 
 
-def page_looks_like_product(response) -> bool:
+def _parse_jsonld(response) -> list:
     """
-    Heuristic: treat as product if we see a stable artikelnummer
-    or JSON-LD Product.
+    All JSON-LD nodes of a page (decoded and flattened via iter_json_ld), parsed once.
+    For a Response the list is memoized on response.meta["_ldjson"];
+    a bare Selector (Selenium HTML) is simply parsed.
     """
-    if extract_listing_id_from_html(response.text):
-        return True
+    meta = getattr(response, "meta", None)
+    if meta is not None and "_ldjson" in meta:
+        return meta["_ldjson"]
 
-    blocks = response.css('script[type="application/ld+json"]::text').getall()
-    for b in blocks:
-        b = (b or "").strip()
-        if not b:
-            continue
-        try:
-            data = json.loads(b)
-        except Exception:
-            continue
-        for n in iter_json_ld(data):
-            if not isinstance(n, dict):
-                continue
-            t = n.get("@type")
-            if t == "Product" or (isinstance(t, list) and "Product" in t):
-                return True
+    nodes = []
+    for b in json_ld_blocks(response):
+        data = load_json_ld(b)
+        if data is not None:
+            nodes.extend(iter_json_ld(data))
 
-    return False
+    if meta is not None:
+        meta["_ldjson"] = nodes
+    return nodes
 
 
 def extract_itemlist_product_urls_from_selector(sel: Selector, base_url: str):
@@ -331,49 +602,38 @@ def extract_itemlist_product_urls_from_selector(sel: Selector, base_url: str):
     Extract product URLs from JSON-LD ItemList. Works on a Scrapy Selector built from Selenium HTML.
     """
     urls = []
-    blocks = sel.css('script[type="application/ld+json"]::text').getall()
-    for b in blocks:
-        b = (b or "").strip()
-        if not b:
-            continue
-        try:
-            data = json.loads(b)
-        except Exception:
+    for n in _parse_jsonld(sel):
+        t = n.get("@type")
+        if not (t == "ItemList" or (isinstance(t, list) and "ItemList" in t)):
             continue
 
-        for n in iter_json_ld(data):
-            if not isinstance(n, dict):
-                continue
-            t = n.get("@type")
-            if not (t == "ItemList" or (isinstance(t, list) and "ItemList" in t)):
-                continue
+        elems = n.get("itemListElement")
+        if not isinstance(elems, list):
+            continue
 
-            elems = n.get("itemListElement")
-            if not isinstance(elems, list):
+        for el in elems:
+            if not isinstance(el, dict):
                 continue
+            item = el.get("item")
+            candidate = None
+            if isinstance(item, dict):
+                candidate = item.get("@id") or item.get("url")
+            elif isinstance(item, str):
+                candidate = item
+            candidate = candidate or el.get("url")
 
-            for el in elems:
-                if not isinstance(el, dict):
-                    continue
-                item = el.get("item")
-                candidate = None
-                if isinstance(item, dict):
-                    candidate = item.get("@id") or item.get("url")
-                elif isinstance(item, str):
-                    candidate = item
-                candidate = candidate or el.get("url")
+            if candidate:
+                full = strip_tracking(scrapy.utils.url.urljoin_rfc(base_url, candidate))
+                if should_follow_url(full) and is_product_url(full):
+                    urls.append(full)
 
-                if candidate:
-                    full = strip_tracking(scrapy.utils.url.urljoin_rfc(base_url, candidate))
-                    if should_follow_url(full) and is_product_url(full):
-                        urls.append(full)
+    # Deduplication happens crawl-wide on the spider (_product_urls_seen).
+    return urls
 
-    return list(dict.fromkeys(urls))
 
-
-def extract_price_from_meta(response):
+def extract_price_from_meta(sel: Selector):
     # First fallback after JSON-LD: meta tags / itemprop price.
-    candidates = response.css(
+    candidates = sel.css(
         'meta[itemprop="price"]::attr(content), '
         'meta[property="product:price:amount"]::attr(content), '
         'meta[property="og:price:amount"]::attr(content), '
@@ -388,21 +648,48 @@ def extract_price_from_meta(response):
     return None, None
 
 
+# Price/buy blocks for the buybox price (the former CSS union, precompiled)
+_XP_BUYBOX_BLOCKS = etree.XPath(
+    '//div[contains(@class, "price")] | //div[contains(@id, "price")] | '
+    '//div[contains(@class, "buy")] | //section[contains(@class, "price")] | '
+    '//section[contains(@class, "buy")]'
+)
+# The 30-day reference label can also sit in the availability block. That block is
+# kept out of the buybox text: its euro amounts (shipping threshold, instalments)
+# would otherwise compete for the lowest "current" price.
+_XP_PRICE_BLOCKS = etree.XPath(
+    '//div[contains(@class, "price")] | //div[contains(@id, "price")] | '
+    '//div[contains(@class, "buy")] | //section[contains(@class, "price")] | '
+    '//section[contains(@class, "buy")] | //div[contains(@class, "availability")]'
+)
+
+
+def _block_text(response, xpath, meta_key):
+    """
+    Cleaned text of the blocks matched by xpath, memoized on response.meta[meta_key].
+    """
+    if meta_key in response.meta:
+        return response.meta[meta_key]
+
+    # itertext() walks each block's text nodes in C. The text nodes are still joined with
+    # spaces: string(.) would glue adjacent nodes ("€ 449" + "30-Dagen" -> "€ 44930-Dagen").
+    blocks = xpath(response.selector.root)
+    text = clean(" ".join(t for el in blocks for t in el.itertext())) if blocks else None
+    response.meta[meta_key] = text
+    return text
+
+
 def extract_price_from_buybox(response):
     """
     Parse prices from a limited DOM block (Not full body text),
     to avoid picking up random numbers from scripts or unrelated content.
     Note: This should be used only to recover current_price, not to infer base_price.
     """
-    block = response.css(
-        'div[class*="price"], div[id*="price"], div[class*="buy"], '
-        'section[class*="price"], section[class*="buy"]'
-    )
-    text = clean(" ".join(block.css("*::text").getall())) if block else None
+    text = _block_text(response, _XP_BUYBOX_BLOCKS, "_buybox_text")
     if not text:
         return None
 
-    euro_vals = re.findall(r"€\s*\d[\d\.\s]*[,\.\d]{0,3}\d", text)
+    euro_vals = _EURO_AMOUNT_RE.findall(text)
     floats = [sane_price(price_to_float(x)) for x in euro_vals]
     floats = [x for x in floats if x is not None]
     if not floats:
@@ -421,26 +708,11 @@ def extract_reference_price_30day(response):
 
     This extracts that reference price (so we can compute discount_amount/percent).
     """
-    block = response.css(
-        'div[class*="price"], div[id*="price"], div[class*="buy"], '
-        'section[class*="price"], section[class*="buy"], '
-        'div[class*="price-and-availability"], div[class*="availability"]'
-    )
-    text = clean(" ".join(block.css("*::text").getall())) if block else None
+    text = _block_text(response, _XP_PRICE_BLOCKS, "_price_text")
     if not text:
         return None
 
-    m = re.search(
-        r"30\s*-\s*Dagen\s*-\s*Beste\s*-\s*Prijs\s*:\s*€\s*([\d\.\s]+(?:,\d{1,2})?)",
-        text,
-        re.IGNORECASE,
-    )
-    if not m:
-        m = re.search(
-            r"30\s*Dagen\s*Beste\s*Prijs\s*:\s*€\s*([\d\.\s]+(?:,\d{1,2})?)",
-            text,
-            re.IGNORECASE,
-        )
+    m = _REF30_RE.search(text) or _REF30_PLAIN_RE.search(text)
 
     if not m:
         return None
@@ -448,32 +720,40 @@ def extract_reference_price_30day(response):
     return sane_price(price_to_float(m.group(1)))
 
 
-def extract_breadcrumb_from_html(response):
+# Breadcrumb anchors, in order of preference. Compiled once at import instead of
+# re-translating CSS to XPath on every product page.
+_BREADCRUMB_ANCHOR_XPATHS = (
+    etree.XPath('//nav[contains(@aria-label, "breadcrumb")]//a'),
+    etree.XPath('//*[contains(concat(" ", normalize-space(@class), " "), " breadcrumb ")]//a'),
+    etree.XPath('//nav[contains(translate(@aria-label, "BREADCRUMB", "breadcrumb"), "breadcrumb")]//a'),
+)
+
+
+def extract_breadcrumb_from_html(sel: Selector, urljoin):
     """
     Fallback: extract breadcrumb from visible HTML navigation.
 
     Returns:
         (category_name, category_url, parent_name)
     """
-    links = response.css('nav[aria-label*="breadcrumb"] a::attr(href)').getall()
-    names = response.css('nav[aria-label*="breadcrumb"] a::text').getall()
-
-    if not links or not names:
-        links = response.css('nav.breadcrumb a::attr(href), .breadcrumb a::attr(href)').getall()
-        names = response.css('nav.breadcrumb a::text, .breadcrumb a::text').getall()
-
-    if not links or not names:
-        links = response.xpath(
-            '//nav[contains(translate(@aria-label, "BREADCRUMB", "breadcrumb"), "breadcrumb")]//a/@href'
-        ).getall()
-        names = response.xpath(
-            '//nav[contains(translate(@aria-label, "BREADCRUMB", "breadcrumb"), "breadcrumb")]//a//text()'
-        ).getall()
-
-    links = [clean(response.urljoin(x)) for x in links if clean(x)]
-    names = [clean(x) for x in names if clean(x)]
+    root = sel.root
+    anchors = []
+    for xp in _BREADCRUMB_ANCHOR_XPATHS:
+        anchors = [a for a in xp(root) if a.get("href")]
+        if anchors:
+            break
+
+    # One pass over the anchors keeps each href paired with its own label.
+    pairs = []
+    for a in anchors:
+        name = clean(" ".join(a.itertext()))
+        href = clean(a.get("href"))
+        if not name or not href:
+            continue
+        u = clean(urljoin(href))
+        if u and looks_like_category_url(u):
+            pairs.append((name, u))
 
-    pairs = [(n, u) for n, u in zip(names, links) if u and looks_like_category_url(u)]
     if not pairs:
         return None, None, None
 
@@ -482,24 +762,28 @@ def extract_breadcrumb_from_html(response):
     return cat_name, cat_url, parent_name
 
 
-def extract_breadcrumb_from_microdata(response):
+# schema.org microdata breadcrumb (same selectors as the former CSS, precompiled)
+_XP_MICRODATA_CRUMBS = etree.XPath(
+    '//ol[contains(@itemtype, "schema.org/BreadcrumbList")]'
+    '//li[contains(@itemtype, "schema.org/ListItem")]'
+)
+_XP_MICRODATA_NAME = etree.XPath('descendant-or-self::*[@itemprop="name"]/text()')
+_XP_MICRODATA_HREF = etree.XPath('descendant-or-self::*[@itemprop="item"]/@href')
+
+
+def extract_breadcrumb_from_microdata(sel: Selector, urljoin):
     """
     Fallback: extract breadcrumb from schema.org microdata (HTML).
 
     Returns:
         (category_name, category_url, parent_name)
     """
-    items = response.css(
-        'ol[itemtype*="schema.org/BreadcrumbList"] '
-        'li[itemtype*="schema.org/ListItem"]'
-    )
-
     crumbs = []
-    for li in items:
-        name = clean(" ".join(li.css('[itemprop="name"]::text').getall()))
-        href = li.css('[itemprop="item"]::attr(href)').get()
+    for li in _XP_MICRODATA_CRUMBS(sel.root):
+        name = clean(" ".join(_XP_MICRODATA_NAME(li)))
+        href = next(iter(_XP_MICRODATA_HREF(li)), None)
         if name and href:
-            crumbs.append((name, clean(response.urljoin(href))))
+            crumbs.append((name, clean(urljoin(href))))
 
     if not crumbs:
         return None, None, None
@@ -509,17 +793,28 @@ def extract_breadcrumb_from_microdata(response):
     return cat_name, cat_url, parent_name
 
 
-def extract_stock_from_html(response):
+# Stock markup: the fx-availability badge (one lookup serves both its text and class)
+# and the schema.org availability link.
+_XP_FX_AVAILABILITY = etree.XPath(
+    '//span[contains(concat(" ", normalize-space(@class), " "), " fx-availability ")]'
+)
+_XP_OWN_TEXT = etree.XPath("text()")
+_XP_AVAILABILITY_LINK = etree.XPath('//link[@itemprop="availability"]/@href')
+
+
+def extract_stock_from_html(sel: Selector):
     """
     Extract Thomann stock status from HTML (server-side, no Selenium needed).
 
     Returns:
       (stock_text, in_stock_bool_or_None)
     """
-    txt = response.css("span.fx-availability::text").get()
+    root = sel.root
+    spans = _XP_FX_AVAILABILITY(root)
+    txt = next((t for sp in spans for t in _XP_OWN_TEXT(sp)), None)
     if txt:
         txt = clean(txt)
-        cls = response.css("span.fx-availability::attr(class)").get("") or ""
+        cls = spans[0].get("class") or ""
 
         if "in-stock" in cls:
             return txt, True
@@ -534,7 +829,7 @@ def extract_stock_from_html(response):
 
         return txt, None
 
-    href = response.css('link[itemprop="availability"]::attr(href)').get()
+    href = next(iter(_XP_AVAILABILITY_LINK(root)), None)
     if href:
         if "InStock" in href:
             return "InStock", True
@@ -567,6 +862,25 @@ class ThomannProductsSpider(scrapy.Spider):
         "AUTOTHROTTLE_START_DELAY": 0.5,
         "AUTOTHROTTLE_MAX_DELAY": 60.0,
         "CONCURRENT_REQUESTS": 1,
+        # No HTTP/2 handler here: Scrapy's H2DownloadHandler cannot tunnel through a
+        # proxy (CONNECT), which the Bright Data proxy / unlocker fallback relies on,
+        # and with one request at a time there is nothing to multiplex.
+        # On-disk HTTP cache for development reruns only; it stays off for real runs,
+        # which must record fresh price/stock snapshots. Opt in with
+        #   scrapy crawl thomann_products -s HTTPCACHE_ENABLED=1
+        # DummyPolicy serves any stored response within the expiry; RFC2616Policy would
+        # revalidate every hit because the project sends Cache-Control/Pragma: no-cache.
+        # Responses returned by BrightDataUnlockerAPIMiddleware (543) short-circuit the
+        # downloader before HttpCacheMiddleware (900), so that path is not cached.
+        # Blocked/throttled responses are never cached.
+        "HTTPCACHE_STORAGE": "scrapy.extensions.httpcache.FilesystemCacheStorage",
+        "HTTPCACHE_POLICY": "scrapy.extensions.httpcache.DummyPolicy",
+        "HTTPCACHE_EXPIRATION_SECS": 86400,
+        "HTTPCACHE_IGNORE_HTTP_CODES": [403, 429, 503, 504],
+        # Fail fast on a stuck DNS lookup (Scrapy's default DNS cache is left as is).
+        "DNS_TIMEOUT": 5,
+        "REQUEST_FINGERPRINTER_IMPLEMENTATION": "2.7",
+        "REQUEST_FINGERPRINTER_CLASS": "odm_scraper.spiders.thomann_products.CanonicalUrlRequestFingerprinter",
         "USER_AGENT": (
             "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
             "AppleWebKit/537.36 (KHTML, like Gecko) "
@@ -577,6 +891,65 @@ class ThomannProductsSpider(scrapy.Spider):
 
     crawler_version = "thomann_products/json+selenium_listing"
 
+    # Anchor fallback in parse_listing: product-looking hrefs of the expanded listing DOM
+    _XP_PRODUCT_HREFS = etree.XPath('//a[contains(@href, ".htm")]/@href')
+
+    # Product item schema; parse_product starts from a shallow copy of this.
+    _ITEM_TEMPLATE = {
+        "type": "product",
+        "competitor_id": COMPETITOR_ID,
+        "competitor_name": COMPETITOR_NAME,
+        "scrape_run_id": None,
+        "scraped_at": None,
+        "source_url": None,
+        "seed_category": "microfoons.html",
+
+        # Stable product identifier on Thomann
+        "listing_id": None,
+
+        # Core product attributes
+        "title": None,
+        "description": None,
+        "brand": None,
+        "gtin": None,
+        "mpn": None,
+        "sku": None,
+        "model": None,
+        "image_url": None,
+
+        # Category/breadcrumb information
+        "breadcrumb_category": None,
+        "breadcrumb_url": None,
+        "breadcrumb_parent": None,
+
+        # Pricing + stock information
+        "currency": "EUR",
+        "price_text": None,
+        "current_price": None,
+        "base_price": None,
+        "discount_amount": None,
+        "discount_percent": None,
+        "stock_status_text": None,
+        "in_stock": None,
+
+        # Reviews
+        "rating_value": None,
+        "rating_scale": 5,
+        "review_count": None,
+
+        # Matching helper
+        "canonical_name": None,
+    }
+
+    # Precompiled XPath for parse_product (skips CSS-to-XPath translation per page):
+    # all HTML fallbacks (h1, title, og:title/og:image/og:description, meta description)
+    # in one traversal; results are keyed by the node they came from.
+    _XP_FALLBACKS = etree.XPath(
+        '//h1/text() | //title/text() | '
+        '//meta[@property="og:title" or @property="og:image" '
+        'or @property="og:description" or @name="description"]/@content'
+    )
+
     # Scrapy calls parse() by default for start_urls (when start_requests not overridden)
     # We keep it anyway (you wanted parse_any retained).
     def parse(self, response):
@@ -584,14 +957,23 @@ class ThomannProductsSpider(scrapy.Spider):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.scrape_run_id = str(uuid.uuid4())
-        self.started_at = iso_utc_now()
-        self.git_commit_hash = get_git_commit_hash()
+        self.scrape_run_id = uuid.uuid4().hex
         self._seed_subcats_emitted = False
+        self._product_urls_seen = set()
 
         # Selenium driver setup (used only for listing expansion)
         self.driver = self._build_selenium_driver()
 
+    # Run metadata is resolved on first use (the "run" record in start_requests),
+    # so constructing the spider for `scrapy list` / settings does no extra work.
+    @cached_property
+    def started_at(self):
+        return iso_utc_now()
+
+    @cached_property
+    def git_commit_hash(self):
+        return get_git_commit_hash()
+
     def closed(self, reason):
         # Ensure Selenium driver is always closed when the spider finishes or crashes.
         try:
@@ -636,18 +1018,21 @@ class ThomannProductsSpider(scrapy.Spider):
         self.logger.info("SELENIUM OPEN %s", url)
         self.driver.get(url)
 
+        # Fast-polling wait (50 ms) so each step continues as soon as the DOM is ready
+        wait = WebDriverWait(self.driver, 25, poll_frequency=0.05)
+
         # Best effort: accept cookie / consent if it appears
         # This prevents Selenium from seeing an empty or blocked product listing
         try:
             btn = self.driver.find_elements(By.CSS_SELECTOR, "#onetrust-accept-btn-handler")
             if btn:
                 btn[0].click()
-                time.sleep(1.0)
+                WebDriverWait(self.driver, 5, poll_frequency=0.05).until(
+                    EC.invisibility_of_element_located((By.CSS_SELECTOR, "#onetrust-accept-btn-handler"))
+                )
         except Exception:
             pass
 
-        wait = WebDriverWait(self.driver, 25)
-
         # Wait until either:
         # - product links are visible
         # - OR the "Toon meer" button exists
@@ -669,7 +1054,14 @@ class ThomannProductsSpider(scrapy.Spider):
             )
             return self.driver.page_source
 
-        time.sleep(1.0)
+        # Let the listing finish loading (scripts that attach the "Toon meer" handler)
+        # instead of a fixed pause; the button itself is awaited in the loop below.
+        try:
+            WebDriverWait(self.driver, 5, poll_frequency=0.05).until(
+                lambda d: d.execute_script("return document.readyState") == "complete"
+            )
+        except TimeoutException:
+            pass
 
         clicks = 0
         while clicks < max_clicks:
@@ -679,7 +1071,10 @@ class ThomannProductsSpider(scrapy.Spider):
 
             button = buttons[0]
             self.driver.execute_script("arguments[0].scrollIntoView({block:'center'});", button)
-            time.sleep(0.4)
+            try:
+                WebDriverWait(self.driver, 5, poll_frequency=0.05).until(EC.element_to_be_clickable(button))
+            except TimeoutException:
+                pass
 
             before_count = len(self.driver.find_elements(By.CSS_SELECTOR, "a[href*='.htm']"))
 
@@ -695,8 +1090,6 @@ class ThomannProductsSpider(scrapy.Spider):
             except TimeoutException:
                 break
 
-            time.sleep(0.4)
-
         self.logger.info("SELENIUM EXPAND DONE | clicks=%s | url=%s", clicks, url)
         return self.driver.page_source
 
@@ -716,15 +1109,20 @@ class ThomannProductsSpider(scrapy.Spider):
         yield scrapy.Request(
             strip_tracking(self.start_urls[0]),
             callback=self.parse_any,
-            meta={"cat_depth": 0},
+            meta={"cat_depth": 0, "canonical": True},
         )
 
     def parse_any(self, response):
-        url = strip_tracking(response.url)
+        url = response_url(response)
         if not should_follow_url(url):
             return
 
-        if page_looks_like_product(response) and is_product_url(url):
+        # The URL shape (.htm product vs .html category) is checked first because it is
+        # free (is_product_url is lru_cached). A product-shaped URL still needs a
+        # listing_id on the page: shell/blocked or non-product .htm pages go to
+        # parse_listing for link discovery instead of yielding empty items.
+        # extract_listing_id is memoized on meta, so parse_product reuses the lookup.
+        if is_product_url(url) and extract_listing_id(response):
             yield from self.parse_product(response)
             return
 
@@ -750,7 +1148,7 @@ class ThomannProductsSpider(scrapy.Spider):
         # Emit seed subcategory URLs once
         if depth == 0 and not self._seed_subcats_emitted:
             self._seed_subcats_emitted = True
-            seed = strip_tracking(response.url)
+            seed = response_url(response)
             for sub in subs:
                 yield {
                     "type": "subcategory",
@@ -758,21 +1156,20 @@ class ThomannProductsSpider(scrapy.Spider):
                     "competitor_name": COMPETITOR_NAME,
                     "scrape_run_id": self.scrape_run_id,
                     "seed_url": seed,
-                    "subcategory_url": strip_tracking(sub),
+                    "subcategory_url": sub,
                 }
 
-        # Crawl deeper subcategories (up to max depth)
+        # Crawl deeper subcategories (up to max depth); subs are already canonical.
         if depth < self.max_category_depth:
             for sub in subs:
-                u = strip_tracking(sub)
                 yield scrapy.Request(
-                    u,
+                    sub,
                     callback=self.parse_listing,
-                    meta={"cat_depth": depth + 1},
+                    meta={"cat_depth": depth + 1, "canonical": True},
                 )
 
         # Selenium expansion for this listing page
-        expanded_html = self.selenium_expand_toon_meer(strip_tracking(response.url))
+        expanded_html = self.selenium_expand_toon_meer(response_url(response))
         sel = Selector(text=expanded_html)
 
         # Prefer JSON-LD ItemList if present in the expanded DOM
@@ -780,15 +1177,10 @@ class ThomannProductsSpider(scrapy.Spider):
 
         # Fallback: anchors in the expanded DOM
         if not product_urls:
-            hrefs = sel.css("a[href*='.htm']::attr(href)").getall()
-            tmp = []
-            for h in hrefs:
-                if not h:
-                    continue
-                u = strip_tracking(response.urljoin(h))
-                if should_follow_url(u) and is_product_url(u):
-                    tmp.append(u)
-            product_urls = list(dict.fromkeys(tmp))
+            product_urls = [
+                u for u in (join_and_strip(response, h) for h in self._XP_PRODUCT_HREFS(sel.root) if h)
+                if should_follow_url(u) and is_product_url(u)
+            ]
 
         self.logger.info(
             "LISTING EXPANDED | %s | products_found=%s",
@@ -796,8 +1188,12 @@ class ThomannProductsSpider(scrapy.Spider):
             len(product_urls),
         )
 
+        # Products are often listed in several categories: request each one once per crawl.
         for u in product_urls:
-            yield scrapy.Request(u, callback=self.parse_product)
+            if u in self._product_urls_seen:
+                continue
+            self._product_urls_seen.add(u)
+            yield scrapy.Request(u, callback=self.parse_product, meta={"canonical": True})
 
     def find_subcategory_urls(self, response, depth: int):
         """
@@ -810,27 +1206,17 @@ class ThomannProductsSpider(scrapy.Spider):
         - Hard exclude accessory/parts categories based on both URL path and label text.
         """
         out = []
-        current = strip_tracking(response.url)
-
-        BLOCKED_CATEGORY_PATH_KEYWORDS = {
-            "video-podcast", "blowouts",
-            "aktionen", "actie", "acties",
-            "b_stock", "b-stock",
-            "sale", "deals", "outlet",
-            "topseller",
-            "prodnews",
-            "bf_", "blackfriday",
-            "alle-producten-in-de-categorie",
-            "brand", "merken",
-        }
+        seen = set()
+        current = response_url(response)
 
-        for a in response.css("a"):
-            href = a.attrib.get("href")
+        # One lxml traversal for all anchors instead of a Scrapy selector per <a>.
+        for a in response.selector.root.xpath(".//a[@href]"):
+            href = a.get("href")
             if not href:
                 continue
 
-            u = strip_tracking(response.urljoin(href))
-            if not should_follow_url(u):
+            u = join_and_strip(response, href)
+            if u in seen or not should_follow_url(u):
                 continue
 
             path = (urlparse(u).path or "").lower()
@@ -843,140 +1229,104 @@ class ThomannProductsSpider(scrapy.Spider):
             if depth > 0 and path.endswith("microfoons.html"):
                 continue
 
-            if any(k in path for k in BLOCKED_CATEGORY_PATH_KEYWORDS):
+            if _BLOCKED_CATEGORY_PATH_RE.search(path):
                 continue
 
-            if depth > 0 and re.search(r"_[a-z0-9]+_microfoons?", path):
+            if depth > 0 and _BRAND_MIC_PATH_RE.search(path):
                 continue
 
-            text = clean(" ".join(a.css("::text").getall()))
+            text = clean(" ".join(a.itertext()))
             label_norm = normalize_category_label(text)
 
-            if any(x in path for x in EXCLUDED_CATEGORY_KEYWORDS) or any(x in label_norm for x in EXCLUDED_CATEGORY_KEYWORDS):
+            if _EXCLUDED_CATEGORY_RE.search(path) or _EXCLUDED_CATEGORY_RE.search(label_norm):
                 continue
 
             if depth == 0:
                 if label_norm in ALLOWED_SUBCATEGORY_NAMES_SEED_NORM:
+                    seen.add(u)
                     out.append(u)
                 continue
 
-            u_low = u.lower()
-            if any(
-                k in u_low
-                for k in [
-                    "microfoon", "microfoons", "mikro", "micro",
-                    "zangmicro", "instrumentenmicro",
-                    "condensator", "grootmembraan", "kleinmembraan",
-                    "ribbon", "headset", "lavalier",
-                    "usb", "podcast", "broadcast",
-                    "zender", "video", "camera", "reporter",
-                    "grensvlak", "installatie", "meetmicro", "ovid",
-                ]
-            ):
+            if _MIC_URL_RE.search(u.lower()):
+                seen.add(u)
                 out.append(u)
 
-        return list(dict.fromkeys(out))
+        return out
+
+    def _html_fallbacks(self, root) -> dict:
+        """
+        First value per source, keyed "h1", "title", "og:title", "og:image",
+        "og:description" and "description" (same as .get() on each selector).
+        """
+        out = {}
+        for r in self._XP_FALLBACKS(root):
+            node = r.getparent()
+            if r.is_attribute:
+                key = node.get("property") or node.get("name")
+            else:
+                # Tail text belongs to a child element; its parent is the h1/title
+                if r.is_tail:
+                    node = node.getparent()
+                key = node.tag
+            out.setdefault(key, r)
+        return out
 
     def parse_product(self, response):
         self.logger.info("PRODUCT %s", response.url)
 
-        item = {
-            "type": "product",
-            "competitor_id": COMPETITOR_ID,
-            "competitor_name": COMPETITOR_NAME,
-            "scrape_run_id": self.scrape_run_id,
-            "scraped_at": iso_utc_now(),
-            "source_url": strip_tracking(response.url),
-            "seed_category": "microfoons.html",
-
-            # Stable product identifier on Thomann
-            "listing_id": None,
-
-            # Core product attributes
-            "title": None,
-            "description": None,
-            "brand": None,
-            "gtin": None,
-            "mpn": None,
-            "sku": None,
-            "model": None,
-            "image_url": None,
-
-            # Category/breadcrumb information
-            "breadcrumb_category": None,
-            "breadcrumb_url": None,
-            "breadcrumb_parent": None,
-
-            # Pricing + stock information
-            "currency": "EUR",
-            "price_text": None,
-            "current_price": None,
-            "base_price": None,
-            "discount_amount": None,
-            "discount_percent": None,
-            "stock_status_text": None,
-            "in_stock": None,
-
-            # Reviews
-            "rating_value": None,
-            "rating_scale": 5,
-            "review_count": None,
-
-            # Matching helper
-            "canonical_name": None,
-        }
+        # One Selector shared by all extract_* helpers below.
+        sel = response.selector
+        root = sel.root
+
+        # Copy of the class-level schema; only the per-response fields are set here.
+        item = self._ITEM_TEMPLATE.copy()
+        item["scrape_run_id"] = self.scrape_run_id
+        item["scraped_at"] = iso_utc_now()
+        item["source_url"] = response_url(response)
 
         # Stable listing_id from Thomann article number
-        item["listing_id"] = extract_listing_id_from_html(response.text)
-
-        # Parse JSON-LD blocks (Product + BreadcrumbList)
-        blocks = response.css('script[type="application/ld+json"]::text').getall()
-        nodes = []
-        for b in blocks:
-            b = (b or "").strip()
-            if not b:
-                continue
-            try:
-                data = json.loads(b)
-                nodes.extend(iter_json_ld(data))
-            except Exception:
-                continue
+        item["listing_id"] = extract_listing_id(response)
 
+        # Product + BreadcrumbList from the page's JSON-LD nodes. The nodes are parsed once
+        # per response (_parse_jsonld memo), and the walk stops once both are found.
         product_ld = None
         breadcrumb_ld = None
-        for n in nodes:
-            if not isinstance(n, dict):
-                continue
+        for n in _parse_jsonld(response):
             t = n.get("@type")
-            if t == "Product" or (isinstance(t, list) and "Product" in t):
-                product_ld = product_ld or n
-            if t == "BreadcrumbList" or (isinstance(t, list) and "BreadcrumbList" in t):
-                breadcrumb_ld = breadcrumb_ld or n
+            types = (t,) if isinstance(t, str) else tuple(t) if isinstance(t, list) else ()
+            if product_ld is None and "Product" in types:
+                product_ld = n
+            if breadcrumb_ld is None and "BreadcrumbList" in types:
+                breadcrumb_ld = n
+            if product_ld is not None and breadcrumb_ld is not None:
+                break
 
         # Extract product fields from Product JSON-LD
         if product_ld:
-            item["title"] = clean(product_ld.get("name"))
-            item["description"] = clean(product_ld.get("description"))
+            # Plain text fields are collected first; clean() only runs on values that exist.
+            raw = {
+                "title": product_ld.get("name"),
+                "description": product_ld.get("description"),
+                "gtin": next((product_ld[k] for k in GTIN_KEYS if product_ld.get(k)), None),
+                "mpn": product_ld.get("mpn"),
+                "sku": product_ld.get("sku"),
+            }
+            agg = product_ld.get("aggregateRating")
+            if isinstance(agg, dict):
+                raw["rating_value"] = agg.get("ratingValue")
+                raw["review_count"] = agg.get("reviewCount") or agg.get("ratingCount")
+
+            for k, v in raw.items():
+                if v is not None:
+                    item[k] = clean(v)
 
             brand = product_ld.get("brand")
-            if isinstance(brand, dict):
-                item["brand"] = clean(brand.get("name"))
+            if b := _first_dict(brand):
+                item["brand"] = clean(b.get("name"))
             elif isinstance(brand, str):
                 item["brand"] = clean(brand)
 
-            for k in ("gtin13", "gtin14", "gtin12", "gtin8", "gtin"):
-                v = product_ld.get(k)
-                if v:
-                    item["gtin"] = clean(v)
-                    break
-
-            if product_ld.get("mpn"):
-                item["mpn"] = clean(product_ld.get("mpn"))
-            if product_ld.get("sku"):
-                item["sku"] = clean(product_ld.get("sku"))
-
-            if product_ld.get("model"):
-                m = product_ld.get("model")
+            if m := product_ld.get("model"):
                 if isinstance(m, dict):
                     item["model"] = clean(m.get("name") or m.get("model"))
                 else:
@@ -988,10 +1338,7 @@ class ThomannProductsSpider(scrapy.Spider):
             elif isinstance(img, str):
                 item["image_url"] = clean(img)
 
-            offers = product_ld.get("offers")
-            if isinstance(offers, list) and offers:
-                offers = offers[0]
-            if isinstance(offers, dict):
+            if offers := _first_dict(product_ld.get("offers")):
                 p = sane_price(price_to_float(offers.get("price")))
                 if p is not None:
                     item["current_price"] = p
@@ -1002,13 +1349,8 @@ class ThomannProductsSpider(scrapy.Spider):
                     item["stock_status_text"] = av
                     item["in_stock"] = ("InStock" in av)
 
-            agg = product_ld.get("aggregateRating")
-            if isinstance(agg, dict):
-                item["rating_value"] = clean(agg.get("ratingValue"))
-                item["review_count"] = clean(agg.get("reviewCount") or agg.get("ratingCount"))
-
         # Final availability extraction (HTML-verified)
-        stock_text, in_stock = extract_stock_from_html(response)
+        stock_text, in_stock = extract_stock_from_html(sel)
         if stock_text and not item["stock_status_text"]:
             item["stock_status_text"] = stock_text
         if item["in_stock"] is None and in_stock is not None:
@@ -1016,62 +1358,61 @@ class ThomannProductsSpider(scrapy.Spider):
 
         # Breadcrumb/category info from BreadcrumbList JSON-LD
         if breadcrumb_ld and isinstance(breadcrumb_ld.get("itemListElement"), list):
-            names = []
-            urls = []
+            # Name and URL are filtered together, so each category keeps its own link.
+            cat_candidates = []
             for el in breadcrumb_ld["itemListElement"]:
-                if isinstance(el, dict):
-                    nm = el.get("name")
-                    it = el.get("item")
-                    names.append(clean(nm))
-                    if isinstance(it, str):
-                        urls.append(clean(it))
-                    elif isinstance(it, dict):
-                        urls.append(clean(it.get("@id")))
-                    else:
-                        urls.append(None)
-
-            names = [n for n in names if n]
-            urls = [u for u in urls if u]
-
-            cat_candidates = [(n, u) for n, u in zip(names, urls) if u and looks_like_category_url(u)]
+                if not isinstance(el, dict):
+                    continue
+                nm = clean(el.get("name"))
+                it = el.get("item")
+                if isinstance(it, str):
+                    u = clean(it)
+                elif isinstance(it, dict):
+                    u = clean(it.get("@id"))
+                else:
+                    u = None
+                if nm and u and looks_like_category_url(u):
+                    cat_candidates.append((nm, u))
+
             if cat_candidates:
                 item["breadcrumb_category"], item["breadcrumb_url"] = cat_candidates[-1]
                 if len(cat_candidates) >= 2:
                     item["breadcrumb_parent"] = cat_candidates[-2][0]
 
-        # Microdata + HTML breadcrumb fallbacks
-        if not item["breadcrumb_category"] or not item["breadcrumb_url"]:
-            cat, cat_url, parent = extract_breadcrumb_from_microdata(response)
-            item["breadcrumb_category"] = item["breadcrumb_category"] or cat
+        # Microdata + HTML breadcrumb fallbacks (only when JSON-LD gave no category).
+        # The HTML navigation is only walked when microdata also found nothing.
+        if not item["breadcrumb_category"]:
+            cat, cat_url, parent = extract_breadcrumb_from_microdata(sel, urljoin=response.urljoin)
+            if not cat:
+                cat, cat_url, parent = extract_breadcrumb_from_html(sel, urljoin=response.urljoin)
+            item["breadcrumb_category"] = cat
             item["breadcrumb_url"] = item["breadcrumb_url"] or cat_url
             item["breadcrumb_parent"] = item["breadcrumb_parent"] or parent
 
-        if not item["breadcrumb_category"] or not item["breadcrumb_url"]:
-            cat, cat_url, parent = extract_breadcrumb_from_html(response)
-            item["breadcrumb_category"] = item["breadcrumb_category"] or cat
-            item["breadcrumb_url"] = item["breadcrumb_url"] or cat_url
-            item["breadcrumb_parent"] = item["breadcrumb_parent"] or parent
+        # HTML fallbacks for core fields (if JSON-LD is missing).
+        # The DOM is only queried when at least one field is still empty, and each
+        # chain stops cleaning candidates at the first usable value.
+        if not (item["title"] and item["image_url"] and item["description"]):
+            fallbacks = self._html_fallbacks(root)
 
-        # HTML fallbacks for core fields (if JSON-LD is missing)
-        if not item["title"]:
-            item["title"] = (
-                clean(response.css("h1::text").get())
-                or clean(response.css('meta[property="og:title"]::attr(content)').get())
-                or clean(response.css("title::text").get())
-            )
+            if not item["title"]:
+                item["title"] = next(
+                    (v for v in (clean(fallbacks.get(k)) for k in ("h1", "og:title", "title")) if v),
+                    None,
+                )
 
-        if not item["image_url"]:
-            item["image_url"] = clean(response.css('meta[property="og:image"]::attr(content)').get())
+            if not item["image_url"]:
+                item["image_url"] = clean(fallbacks.get("og:image"))
 
-        if not item["description"]:
-            item["description"] = (
-                clean(response.css('meta[name="description"]::attr(content)').get())
-                or clean(response.css('meta[property="og:description"]::attr(content)').get())
-            )
+            if not item["description"]:
+                item["description"] = next(
+                    (v for v in (clean(fallbacks.get(k)) for k in ("description", "og:description")) if v),
+                    None,
+                )
 
         # Price fallbacks: meta tags -> buybox current price (avoid full body scan)
         if item["current_price"] is None:
-            p, ptxt = extract_price_from_meta(response)
+            p, ptxt = extract_price_from_meta(sel)
             if p is not None:
                 item["current_price"] = p
                 item["price_text"] = item["price_text"] or ptxt
@@ -1081,13 +1422,14 @@ class ThomannProductsSpider(scrapy.Spider):
             buybox_cur = extract_price_from_buybox(response)
             item["current_price"] = buybox_cur
 
-        self.logger.info(
-            "BUYBOX PRICE DEBUG | %s | buybox_cur=%r | final_current=%r final_base=%r",
-            response.url,
-            buybox_cur,
-            item["current_price"],
-            item["base_price"],
-        )
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(
+                "BUYBOX PRICE DEBUG | %s | buybox_cur=%r | final_current=%r final_base=%r",
+                response.url,
+                buybox_cur,
+                item["current_price"],
+                item["base_price"],
+            )
 
         # Thomann-specific discount reference: 30-Day Best Price
         # Only use as base_price if it is actually higher than current_price.
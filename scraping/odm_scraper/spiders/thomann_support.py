@@ -31,10 +31,18 @@ import json
 import os
 import re
 import hashlib
+import itertools
 from datetime import datetime, timezone
-from urllib.parse import urlparse
+from functools import lru_cache
 
 import scrapy
+from lxml import etree
+
+try:
+    # orjson is optional: same dict/list results as json, parsed faster (and straight from bytes).
+    import orjson
+except ImportError:
+    orjson = None
 
 
 # Competitor metadata (fixed IDs for ERD consistency)
@@ -42,6 +50,27 @@ COMPETITOR_ID = 4
 COMPETITOR_NAME = "Thomann"
 
 
+# Regex patterns, compiled once at import time (used on every product page)
+_WS_RE = re.compile(r"\s+")
+_FREE_SHIPPING_RE = re.compile(
+    r"(?:geen\s+verzendkosten|gratis\s+verzending).{0,160}?\bvanaf\b.{0,40}?€\s*([0-9]+(?:[.,][0-9]{1,2})?)",
+    re.IGNORECASE,
+)
+_EMAIL_RE = re.compile(r"\b[a-z0-9._%+\-]+@thomann\.[a-z]{2,}\b", re.IGNORECASE)
+_PHONE_RE = re.compile(r"\+\d{1,3}[\s\-]?\d{1,4}[\s\-]?\d{2,4}[\s\-]?\d{2,6}")
+_COOLING_OFF_RE = re.compile(r"(\d+)\s*dagen\s*(?:money-?back|moneyback|bedenktijd)", re.IGNORECASE)
+# Warranty years as digits ("3 jaar") or a Dutch number word ("drie jaar"), in one scan
+_WARRANTY_RE = re.compile(
+    r"(?:(\d+)\s*|\b(een|twee|drie|vier|vijf)\s+)(?:jaar|jaren)\s+thomann\s+garantie",
+    re.IGNORECASE,
+)
+_NUMBER_WORDS = {"een": 1, "twee": 2, "drie": 3, "vier": 4, "vijf": 5}
+# Channel/courier keywords; case-insensitive search avoids a lowercased copy of the page.
+# "chat" covers "chat nu" / "chatten" / "chat met", "ups" covers "ups express".
+_CHAT_RE = re.compile(r"chat", re.IGNORECASE)
+_COURIER_RE = re.compile(r"dhl|ups|dpd|gls|fedex", re.IGNORECASE)
+
+
 # Helpers
 
 def iso_utc_now() -> str:
@@ -51,45 +80,75 @@ def iso_utc_now() -> str:
 def clean(text):
     if text is None:
         return None
-    return re.sub(r"\s+", " ", str(text)).strip() or None
+    return _WS_RE.sub(" ", str(text)).strip() or None
+
+
+_XP_VISIBLE_TEXT = etree.XPath(
+    "//body//*[not(self::script) and not(self::style) and not(self::noscript)]/text()"
+)
+_XP_LABEL_ATTRS = etree.XPath("//@alt | //@title | //@aria-label")
+# Only hrefs that mention a support page (case-insensitive, like the old u.lower() check);
+# "helpdesk" also covers helpdesk_shipping
+_XP_CS_LINK_HREFS = etree.XPath(
+    "//a[contains(translate(@href, 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'helpdesk')"
+    " or contains(translate(@href, 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'compinfo_contact')]/@href"
+)
 
 
 def visible_body_text(response) -> str:
     """
     Returns visible text from <body>, excluding script/style/noscript.
     Prevents GTM/dataLayer JS from polluting extracted text.
+    The compiled XPath runs on the lxml root, so the text nodes come back as plain
+    strings instead of one Selector object per node.
     """
-    parts = response.xpath(
-        "//body//*[not(self::script) and not(self::style) and not(self::noscript)]/text()"
-    ).getall()
+    parts = _XP_VISIBLE_TEXT(response.selector.root)
     return clean(" ".join(parts)) or ""
 
 
-def has_delivery_courier(response) -> bool:
+def has_delivery_courier(response, full_text=None) -> bool:
     """
     Detects couriers specifically for delivery_courier_available.
     Checks:
-      1) visible body text (e.g. 'DHL:' next to logo)
+      1) visible body text (e.g. 'DHL:' next to logo); pass full_text when the
+         caller already extracted it, so the body is not walked twice
       2) alt/title/aria-label attributes (e.g. courier logos)
     Returns True/False (never None).
     """
-    couriers = ["dhl", "ups", "ups express", "dpd", "gls", "fedex"]
-
     # 1) Visible text
-    text = (visible_body_text(response) or "").lower()
-    if any(c in text for c in couriers):
+    if full_text is None:
+        full_text = visible_body_text(response)
+    if _COURIER_RE.search(full_text or ""):
         return True
 
     # 2) Attributes (logo alt/title/aria-label)
-    attrs = " ".join(
-        response.xpath("//@alt | //@title | //@aria-label").getall()
-    ).lower()
-    if any(c in attrs for c in couriers):
+    attrs = " ".join(_XP_LABEL_ATTRS(response.selector.root))
+    if _COURIER_RE.search(attrs):
         return True
 
     return False
 
 
+COOKIE_CONSENT_PHRASES = [
+    "met onze cookies",
+    "cookies",
+    "cookiebeleid",
+    "cookie policy",
+    "cookie-instellingen",
+    "cookie instellingen",
+    "gebruik van cookies",
+    "privacy-instellingen",
+    "privacy instellingen",
+    "toestemming",
+    "consent",
+    "akkoord",
+    "accept all",
+    "alles accepteren",
+]
+# One case-insensitive alternation: a single scan, no lowercased copy of the text
+_COOKIE_CONSENT_RE = re.compile("|".join(map(re.escape, COOKIE_CONSENT_PHRASES)), re.IGNORECASE)
+
+
 def is_cookie_consent_text(text: str) -> bool:
     """
     Heuristic filter: if the extracted text is primarily cookie/consent content,
@@ -97,35 +156,33 @@ def is_cookie_consent_text(text: str) -> bool:
     """
     if not text:
         return False
-    t = text.lower()
-    return any(
-        phrase in t
-        for phrase in [
-            "met onze cookies",
-            "cookies",
-            "cookiebeleid",
-            "cookie policy",
-            "cookie-instellingen",
-            "cookie instellingen",
-            "gebruik van cookies",
-            "privacy-instellingen",
-            "privacy instellingen",
-            "toestemming",
-            "consent",
-            "akkoord",
-            "accept all",
-            "alles accepteren",
-        ]
-    )
+    return bool(_COOKIE_CONSENT_RE.search(text))
 
 
 def stable_int_key(s: str, *, mod: int = 2_000_000_000) -> int:
     # Generate a stable integer key from a string using SHA-1 hashing
     # Used to create reproducible numeric IDs (e.g. for deduplication)
+    # First 6 digest bytes == first 12 hex chars, without the hex round-trip.
     if s is None:
         s = ""
-    h = hashlib.sha1(s.encode("utf-8")).hexdigest()
-    return int(h[:12], 16) % mod
+    d = hashlib.sha1(s.encode("utf-8")).digest()
+    return int.from_bytes(d[:6], "big") % mod
+
+
+class _EurCharTable(dict):
+    """
+    str.translate table for to_decimal_eur, doing all former steps in one pass:
+    "." (thousands) is dropped, "," becomes the decimal ".", digits are kept and
+    everything else ("€", spaces, text) is deleted. Unseen code points are cached.
+    """
+
+    def __missing__(self, cp):
+        keep = cp if chr(cp).isdecimal() else None
+        self[cp] = keep
+        return keep
+
+
+_EUR_CHARS = _EurCharTable({ord("."): None, ord(","): "."})
 
 
 def to_decimal_eur(s):
@@ -133,9 +190,7 @@ def to_decimal_eur(s):
     # Handles symbols, thousand separators, and commas as decimals
     if s is None:
         return None
-    s = str(s).strip().replace("€", "").strip()
-    s = s.replace(".", "").replace(",", ".")
-    s = re.sub(r"[^\d.]", "", s)
+    s = str(s).translate(_EUR_CHARS)
     if not s:
         return None
     try:
@@ -150,14 +205,23 @@ def text_has_any(text, words):
     return any(w.lower() in t for w in words)
 
 
+# scheme://netloc prefix, the same netloc urlparse() would report
+_NETLOC_RE = re.compile(r"(?:[A-Za-z][A-Za-z0-9+.\-]*:)?//([^/?#]*)")
+
+
+@lru_cache(maxsize=16384)
 def is_thomann_domain(url: str) -> bool:
     # Verify that a URL belongs to the thomann.nl domain
     if not url:
         return False
-    try:
-        return urlparse(url).netloc.endswith("thomann.nl")
-    except Exception:
+    # urlparse() dropped surrounding whitespace before reading the netloc; the anchored
+    # match needs the same
+    m = _NETLOC_RE.match(url.strip())
+    if not m:
         return False
+    # Exact host or a subdomain; a bare endswith would also accept e.g. "notthomann.nl"
+    host = m.group(1).rpartition("@")[2].partition(":")[0].lower()
+    return host == "thomann.nl" or host.endswith(".thomann.nl")
 
 
 # Bright Data proxy handling
@@ -202,18 +266,30 @@ BLOCKED_MARKERS = [
     "forbidden",
     "robot",
 ]
+_BLOCKED_RE = re.compile("|".join(map(re.escape, BLOCKED_MARKERS)), re.IGNORECASE)
+# Bot-protection markers from BLOCKED_MARKERS; these win over a Thomann <title>.
+# "robot" is matched as a whole word so <meta name="robots"> does not count.
+_HARD_BLOCKED_RE = re.compile(r"captcha|access denied|forbidden|\brobot\b", re.IGNORECASE)
+_TITLE_RE = re.compile(r"<title[^>]*>(.*?)</title>", re.IGNORECASE | re.DOTALL)
 
 
 def looks_like_shell_or_blocked_html(html):
     # Heuristic: return True when the HTML likely isn't the real page content
     if not html:
         return True
-    low = html.lower()
-    if any(m in low for m in BLOCKED_MARKERS):
+    # The length check is free, so it runs before the marker scan
+    if len(html) < 20_000:
         return True
-    if len(low) < 20_000:
+    # Captcha / access-denied pages can carry a Thomann-branded title, so they are
+    # checked before the title shortcut below.
+    if _HARD_BLOCKED_RE.search(html):
         return True
-    return False
+    # Otherwise a full-size page titled as a Thomann page is the real thing, even
+    # though its cookie banner contains "cookie"/"consent" markers.
+    m = _TITLE_RE.search(html)
+    if m and "thomann" in m.group(1).lower():
+        return False
+    return bool(_BLOCKED_RE.search(html))
 
 
 def selenium_enabled():
@@ -221,14 +297,11 @@ def selenium_enabled():
     return str(os.getenv("USE_SELENIUM", "")).strip().lower() in {"1", "true", "yes", "y", "on"}
 
 
-def render_with_selenium(url: str, wait_seconds: int = 6) -> str:
+def build_selenium_driver():
+    # One headless Chrome, built on the first fallback and reused by the spider until it closes
     from selenium import webdriver
     from selenium.webdriver.chrome.options import Options
     from selenium.webdriver.chrome.service import Service
-    from selenium.webdriver.common.by import By
-    from selenium.webdriver.support.ui import WebDriverWait
-    from selenium.webdriver.support import expected_conditions as EC
-    import time
 
     # Optional: allow user-provided chromedriver path via env var
     chromedriver_path = os.getenv("CHROMEDRIVER")
@@ -245,13 +318,24 @@ def render_with_selenium(url: str, wait_seconds: int = 6) -> str:
         "--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
         "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0 Safari/537.36"
     )
+    # driver.get() returns at DOMContentLoaded; the size wait below covers the rest
+    options.page_load_strategy = "eager"
+
+    return webdriver.Chrome(service=service, options=options)
 
-    driver = webdriver.Chrome(service=service, options=options)
-    try:
-        driver.get(url)
-        time.sleep(1.2) # brief initial load delay
 
-      # Try to dismiss common cookie/consent dialogs (best-effort)
+def render_with_selenium(driver, url: str, wait_seconds: int = 6, dismiss_consent: bool = True) -> str:
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.webdriver.support import expected_conditions as EC
+    import time
+
+    driver.get(url)
+    time.sleep(1.2) # brief initial load delay
+
+    # Try to dismiss common cookie/consent dialogs (best-effort).
+    # The consent cookie lives in the reused browser session, so this is only needed once.
+    if dismiss_consent:
         for xpath in [
             "//button[contains(translate(., 'AKKOORDACCEPT', 'akkoordaccept'), 'akkoord')]",
             "//button[contains(translate(., 'AKKOORDACCEPT', 'akkoordaccept'), 'accept')]",
@@ -264,17 +348,15 @@ def render_with_selenium(url: str, wait_seconds: int = 6) -> str:
                 break
             except Exception:
                 pass
-        # Wait until the page looks "complete enough" (body exists and is large)
-        wait = WebDriverWait(driver, max(2, int(wait_seconds)))
-        try:
-            wait.until(lambda d: (len(d.find_elements(By.CSS_SELECTOR, "body")) > 0 and len(d.page_source) > 30_000))
-        except Exception:
-            pass
+    # Wait until the page looks "complete enough" (body exists and is large)
+    wait = WebDriverWait(driver, max(2, int(wait_seconds)))
+    try:
+        wait.until(lambda d: (len(d.find_elements(By.CSS_SELECTOR, "body")) > 0 and len(d.page_source) > 30_000))
+    except Exception:
+        pass
 
-        time.sleep(0.8)
-        return driver.page_source
-    finally:
-        driver.quit()
+    time.sleep(0.8)
+    return driver.page_source
 
 
 # Spider
@@ -295,7 +377,13 @@ class ThomannSupportSpider(scrapy.Spider):
         "AUTOTHROTTLE_ENABLED": True,
         "AUTOTHROTTLE_START_DELAY": 1.0,
         "AUTOTHROTTLE_MAX_DELAY": 10.0,
-        "CONCURRENT_REQUESTS": 2,
+        # Product pages go through the Bright Data proxy and only need a text scan:
+        # keep several in flight and let AutoThrottle back off if Thomann slows down.
+        # HTTP/2 stays off: every request is tunnelled through the proxy (CONNECT),
+        # which Scrapy's H2 handler does not support.
+        "AUTOTHROTTLE_TARGET_CONCURRENCY": 4.0,
+        "CONCURRENT_REQUESTS": 16,
+        "CONCURRENT_REQUESTS_PER_DOMAIN": 8,
         "USER_AGENT": (
             "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
             "AppleWebKit/537.36 (KHTML, like Gecko) "
@@ -336,6 +424,12 @@ class ThomannSupportSpider(scrapy.Spider):
             "expert_support_text": None,
             "customer_service_url": self.CONTACT_URL,
         }
+        # Selenium driver for the fallback: created on first use, closed in closed()
+        # USE_SELENIUM is read once here instead of on every response
+        self.use_selenium = selenium_enabled()
+        self._driver = None
+        self._consent_dismissed = False
+
          # Load product rows from the products export file
         self.product_rows = self._load_products(self.input_file)
         self.logger.info("Loaded %s product rows from input_file=%s", len(self.product_rows), self.input_file)
@@ -346,7 +440,7 @@ class ThomannSupportSpider(scrapy.Spider):
 
     def maybe_render(self, response):
         # If Selenium is enabled and the HTML looks blocked/incomplete, re-render it
-        if not selenium_enabled():
+        if not self.use_selenium:
             return response
         html = response.text or ""
         if not looks_like_shell_or_blocked_html(html):
@@ -354,13 +448,36 @@ class ThomannSupportSpider(scrapy.Spider):
 
         self.logger.warning("Selenium fallback: %s", response.url)
         try:
-            html2 = render_with_selenium(response.url, wait_seconds=self.selenium_wait)
+            if self._driver is None:
+                self._driver = build_selenium_driver()
+            html2 = render_with_selenium(
+                self._driver,
+                response.url,
+                wait_seconds=self.selenium_wait,
+                dismiss_consent=not self._consent_dismissed,
+            )
+            self._consent_dismissed = True
             from scrapy.http import HtmlResponse
             return HtmlResponse(url=response.url, body=html2, encoding="utf-8", request=response.request)
         except Exception as exc:
             self.logger.warning("Selenium render failed url=%s err=%s", response.url, exc)
+            # Drop a possibly broken browser; the next fallback starts a fresh one
+            self._quit_driver()
             return response
 
+    def _quit_driver(self):
+        try:
+            if self._driver is not None:
+                self._driver.quit()
+        except Exception:
+            pass
+        self._driver = None
+        self._consent_dismissed = False
+
+    def closed(self, reason):
+        # Ensure the Selenium driver is always closed when the spider finishes or crashes.
+        self._quit_driver()
+
     def _load_products(self, path):
         """
         Accepts JSONL/JSON produced by products spider.
@@ -375,10 +492,6 @@ class ThomannSupportSpider(scrapy.Spider):
             self.logger.error("input_file not found: %s", path)
             return rows
 
-        raw = open(path, "r", encoding="utf-8").read().strip()
-        if not raw:
-            return rows
-
         def add_obj(obj):
             # Keep only product records from thomann.nl, and build a minimal row dict
             if not isinstance(obj, dict):
@@ -386,41 +499,49 @@ class ThomannSupportSpider(scrapy.Spider):
             if obj.get("type") != "product":
                 return
 
-            url = obj.get("source_url")
+            url = (obj.get("source_url") or "").strip()
             if not url or not is_thomann_domain(url):
                 return
 
-            listing_id = obj.get("listing_id")
             rows.append(
                 {
-                    "product_url": url.strip(),
-                    "listing_id": listing_id,
-                    "listing_key": stable_int_key(url.strip()),
+                    "product_url": url,
+                    "listing_id": obj.get("listing_id"),
+                    "listing_key": stable_int_key(url),
                 }
             )
 
-        # JSON array
-        if raw.startswith("["):
-            try:
-                data = json.loads(raw)
-            except Exception as e:
-                self.logger.error("Failed to parse JSON array: %s", e)
+        loads = orjson.loads if orjson is not None else json.loads
+
+        # Stream the file as bytes: JSONL rows are decoded one line at a time
+        # instead of reading and splitting the whole export up front.
+        with open(path, "rb") as f:
+            lines = (line.strip() for line in f)
+            first = next((line for line in lines if line), None)
+            if first is None:
                 return rows
-            if isinstance(data, list):
-                for obj in data:
-                    add_obj(obj)
-            return rows
 
-        # JSONL
-        for line in raw.splitlines():
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                obj = json.loads(line)
-            except Exception:
-                continue
-            add_obj(obj)
+            # JSON array
+            if first.startswith(b"["):
+                try:
+                    data = loads(first + b"\n" + f.read())
+                except Exception as e:
+                    self.logger.error("Failed to parse JSON array: %s", e)
+                    return rows
+                if isinstance(data, list):
+                    for obj in data:
+                        add_obj(obj)
+                return rows
+
+            # JSONL
+            for line in itertools.chain((first,), lines):
+                if not line:
+                    continue
+                try:
+                    obj = loads(line)
+                except Exception:
+                    continue
+                add_obj(obj)
 
         return rows
 
@@ -450,16 +571,12 @@ class ThomannSupportSpider(scrapy.Spider):
             # Extract visible text and detect free shipping threshold
             full_text = visible_body_text(response)
 
-            m = re.search(
-                r"(?:geen\s+verzendkosten|gratis\s+verzending).{0,160}?\bvanaf\b.{0,40}?€\s*([0-9]+(?:[.,][0-9]{1,2})?)",
-                full_text,
-                flags=re.IGNORECASE,
-            )
+            m = _FREE_SHIPPING_RE.search(full_text)
             if m:
                 self.global_customer_service["free_shipping_threshold_amt"] = to_decimal_eur(m.group(1))
 
             # Determine whether courier delivery is mentioned (robust: text + attributes)
-            self.global_customer_service["delivery_courier_available"] = has_delivery_courier(response)
+            self.global_customer_service["delivery_courier_available"] = has_delivery_courier(response, full_text)
 
         yield scrapy.Request(
             self.CONTACT_URL,
@@ -478,16 +595,16 @@ class ThomannSupportSpider(scrapy.Spider):
             # Parse visible body text to detect support channels (chat/email/phone)
             full_text = visible_body_text(response)
 
-            if text_has_any(full_text, ["chat", "chat nu", "chatten", "chat met"]):
+            if _CHAT_RE.search(full_text):
                 self.global_expert_support["expert_chat_available"] = True
        
             # Email can be detected via mailto links or email patterns in text
             mailtos = response.css("a[href^='mailto:']::attr(href)").getall()
-            if mailtos or re.search(r"\b[a-z0-9._%+\-]+@thomann\.[a-z]{2,}\b", full_text, re.IGNORECASE):
+            if mailtos or _EMAIL_RE.search(full_text):
                 self.global_expert_support["email_support_available"] = True
 
             # Phone detection via a loose international phone pattern
-            if re.search(r"\+\d{1,3}[\s\-]?\d{1,4}[\s\-]?\d{2,4}[\s\-]?\d{2,6}", full_text):
+            if _PHONE_RE.search(full_text):
                 self.global_expert_support["phone_support_available"] = True
 
             # store expert_support_text, but null it if it's cookie/consent text
@@ -516,24 +633,29 @@ class ThomannSupportSpider(scrapy.Spider):
         product_url = response.meta.get("product_url") or response.url
         listing_key = response.meta.get("listing_key") or stable_int_key(product_url)
         listing_id = response.meta.get("listing_id")
+        # Global values are read once into locals for both items below
+        gcs = self.global_customer_service
+        ges = self.global_expert_support
 
         full_text = visible_body_text(response)
+        # Lowercased once for all keyword checks below (text_has_any would copy it per call)
+        low = full_text.lower()
 
         # shipping included if "standard delivery" + "free" appears
         shipping_included = None
-        if text_has_any(full_text, ["standaard levering"]) and text_has_any(full_text, ["gratis"]):
+        if "standaard levering" in low and "gratis" in low:
             shipping_included = True
-        elif text_has_any(full_text, ["verzendkosten", "bezorgkosten"]):
+        elif "verzendkosten" in low or "bezorgkosten" in low:
             shipping_included = False
 
         # Availability/delivery info 
-        delivery_shipping_available = True if text_has_any(
-            full_text, ["levering binnen", "levertijd", "werkdagen", "direct leverbaar"]
+        delivery_shipping_available = True if any(
+            w in low for w in ("levering binnen", "levertijd", "werkdagen", "direct leverbaar")
         ) else None
         
         # Cooling-off / money-back period (days)
         cooling_off_days = None
-        m = re.search(r"(\d+)\s*dagen\s*(?:money-?back|moneyback|bedenktijd)", full_text, re.IGNORECASE)
+        m = _COOLING_OFF_RE.search(full_text)
         if m:
             try:
                 cooling_off_days = int(m.group(1))
@@ -544,34 +666,21 @@ class ThomannSupportSpider(scrapy.Spider):
         warranty_provider = None
         warranty_duration_months = None
 
-        m = re.search(r"(\d+)\s*(?:jaar|jaren)\s+thomann\s+garantie", full_text, re.IGNORECASE)
+        m = _WARRANTY_RE.search(full_text)
         if m:
-            try:
-                years = int(m.group(1))
-                warranty_provider = COMPETITOR_NAME
-                warranty_duration_months = years * 12
-            except Exception:
-                pass
-        else:
-            m = re.search(r"\bdrie\s+jaar\s+thomann\s+garantie\b", full_text, re.IGNORECASE)
-            if m:
-                warranty_provider = COMPETITOR_NAME
-                warranty_duration_months = 36
+            years = int(m.group(1)) if m.group(1) else _NUMBER_WORDS[m.group(2).lower()]
+            warranty_provider = COMPETITOR_NAME
+            warranty_duration_months = years * 12
 
         # Try to find a relevant support/helpdesk/contact link on the product page
         customer_service_url = None
-        for h in response.css("a::attr(href)").getall():
-            if not h:
-                continue
+        for h in _XP_CS_LINK_HREFS(response.selector.root):
             u = response.urljoin(h)
-            if not is_thomann_domain(u):
-                continue
-            ul = u.lower()
-            if "helpdesk_shipping" in ul or "helpdesk" in ul or "compinfo_contact" in ul:
+            if is_thomann_domain(u):
                 customer_service_url = u
                 break
         if customer_service_url is None:
-            customer_service_url = self.global_expert_support.get("customer_service_url") or self.CONTACT_URL
+            customer_service_url = ges.get("customer_service_url") or self.CONTACT_URL
 
         # Emit customer service record for this listing (includes global + per-page fields)
         yield {
@@ -581,10 +690,10 @@ class ThomannSupportSpider(scrapy.Spider):
             "listing_id": listing_id,
             "scraped_at": scraped_at,
             "shipping_included": shipping_included,
-            "free_shipping_threshold_amt": self.global_customer_service.get("free_shipping_threshold_amt"),
+            "free_shipping_threshold_amt": gcs.get("free_shipping_threshold_amt"),
             "pickup_point_available": None,
             "delivery_shipping_available": delivery_shipping_available,
-            "delivery_courier_available": self.global_customer_service.get("delivery_courier_available"),
+            "delivery_courier_available": gcs.get("delivery_courier_available"),
             "cooling_off_days": cooling_off_days,
             "free_returns": None,
             "warranty_provider": warranty_provider,
@@ -601,10 +710,10 @@ class ThomannSupportSpider(scrapy.Spider):
             "listing_id": listing_id,
             "scraped_at": scraped_at,
             "source_url": product_url,
-            "expert_chat_available": self.global_expert_support.get("expert_chat_available"),
-            "phone_support_available": self.global_expert_support.get("phone_support_available"),
-            "email_support_available": self.global_expert_support.get("email_support_available"),
+            "expert_chat_available": ges.get("expert_chat_available"),
+            "phone_support_available": ges.get("phone_support_available"),
+            "email_support_available": ges.get("email_support_available"),
             "in_store_support": False,
-            "expert_support_text": self.global_expert_support.get("expert_support_text"),
+            "expert_support_text": ges.get("expert_support_text"),
             "listing_key": listing_key,
         }